@@ -9,15 +9,20 @@ import os
 import sys
 import json
 import logging
+import hashlib
+import importlib.machinery
+import shutil
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 import pandas as pd
 import re
-import pdfplumber
-from dataclasses import dataclass
+import pypdfium2 as pdfium
+from dataclasses import dataclass, field
 from enum import Enum
 import subprocess
 import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial, wraps
 
 # Load environment variables from .env file
 try:
@@ -38,6 +43,153 @@ except ImportError:
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+MODEL_NAME = 'gemini-2.5-flash'
+
+# Static part of the parser generation prompt. It is identical on every attempt, so it is
+# configured once as the model's system instruction instead of being rebuilt per request.
+# At ~350 tokens it is below the explicit context-caching minimum; Gemini 2.5 models cache
+# the repeated prefix implicitly.
+PARSER_SYSTEM_PROMPT = """
+You are a Python expert creating bank statement PDF parsers.
+
+CRITICAL REQUIREMENTS:
+1. Function signature: def parse(pdf_path: str) -> pd.DataFrame
+2. Return DataFrame with EXACTLY these columns: Date, Description, Debit Amt, Credit Amt, Balance
+3. Date column: Parse dates in DD/MM/YYYY or DD-MM-YYYY format and keep as string (do not convert to YYYY-MM-DD)
+4. Description: Clean transaction descriptions, remove extra whitespace
+5. Debit Amt: Positive amounts for debits, 0.0 for credits, float type
+6. Credit Amt: Positive amounts for credits, 0.0 for debits, float type  
+7. Balance: Account balance after transaction, float type
+8. Handle various PDF layouts - transactions might be in tables or text blocks
+9. Use regex patterns to extract transaction data
+   Read page text with pypdfium2 (pdfium.PdfDocument(pdf_path)[i].get_textpage().get_text_range(),
+   split with splitlines()) - the PDF sample text below was extracted this way. Use pdfplumber only for tables.
+10. Include proper error handling and return empty DataFrame if parsing fails
+11. Ignore header/footer lines such as "Date Description Debit Amt Credit Amt Balance" or page footers.
+12. For every line that is not matched by the transaction regex, log or print the line for debugging.
+
+PARSING STRATEGY:
+- Look for date patterns (DD/MM/YYYY, DD-MM-YYYY, DD.MM.YYYY)
+- Extract transaction descriptions (usually after date)
+- Identify debit/credit indicators (Dr/Cr, +/-, or separate columns)
+- Parse amounts (handle commas, currency symbols)
+- Extract running balance
+- Clean and validate all data
+
+Generate ONLY the Python code for the parser, starting with imports.
+Use pandas, re, pypdfium2 (import pypdfium2 as pdfium), pdfplumber, and datetime modules.
+"""
+
+# Only the start of the statement is shown to the LLM
+PDF_SAMPLE_CHARS = 2000
+
+# Below this many pages (or with a single CPU), starting worker processes costs more than extracting in-process
+PARALLEL_MIN_PAGES = 8
+
+# Per-task part of the prompt; formatted once per task, only the error context changes per attempt
+PARSER_PROMPT_TEMPLATE = """
+Create the parser for {bank} bank.
+
+PDF SAMPLE TEXT (first {sample_chars} chars):
+{text}
+
+EXPECTED CSV SCHEMA:
+Columns: {cols}
+Data types: {dtypes}
+Sample data:
+{sample}
+"""
+
+# Runs a generated parser in a fresh interpreter and pickles its DataFrame.
+# argv: parser directory, parser module name, PDF path, output file
+PARSER_RUNNER = """
+import pickle, sys
+sys.path.insert(0, sys.argv[1])
+parser_module = __import__(sys.argv[2])
+result_df = parser_module.parse(sys.argv[3])
+with open(sys.argv[4], 'wb') as f:
+    pickle.dump(result_df, f)
+"""
+PARSER_TIMEOUT_SECONDS = 300
+
+# On-disk cache for extraction results, shared across agent runs
+CACHE_DIR = Path.home() / ".cache" / "bank_agent"
+CACHE_VERSION = 4  # Bump when a cached result's format changes
+
+def _disk_cached(suffix: str, dump: Callable[[object], str], load: Callable[[str], object]) -> Callable:
+    """Cache a method's result on disk, keyed by the input file's content hash and mtime
+    
+    Callers that already stat'ed the input can pass it as stat_result to skip another stat call.
+    """
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        def wrapper(self, path: str, *args, stat_result: Optional[os.stat_result] = None, **kwargs):
+            try:
+                digest = hashlib.blake2b(Path(path).read_bytes(), digest_size=16)
+                mtime_ns = (stat_result or os.stat(path)).st_mtime_ns
+                key = (func.__name__, CACHE_VERSION, mtime_ns, args, sorted(kwargs.items()))
+                digest.update(repr(key).encode())
+                cache_file = CACHE_DIR / f"{digest.hexdigest()}{suffix}"
+            except OSError:
+                # Unreadable input: let the wrapped method report the error
+                return func(self, path, *args, **kwargs)
+            
+            if cache_file.exists():
+                try:
+                    # Bytes round-trip so text mode cannot translate newlines in cached results
+                    result = load(cache_file.read_bytes().decode("utf-8"))
+                    logger.info(f"Loaded cached {func.__name__} result for {path}")
+                    return result
+                except (OSError, ValueError) as e:
+                    logger.warning(f"Ignoring unreadable cache file {cache_file}: {e}")
+            
+            result = func(self, path, *args, **kwargs)
+            if result:  # Failures return empty results and should be retried next run
+                tmp_path = None
+                try:
+                    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                    # Write to a temp file and rename it into place, so an interrupted or concurrent
+                    # run never leaves a truncated entry behind
+                    fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix=".tmp")
+                    with os.fdopen(fd, "wb") as f:
+                        f.write(dump(result).encode("utf-8"))
+                    os.replace(tmp_path, cache_file)
+                except OSError as e:
+                    logger.warning(f"Failed to write cache file {cache_file}: {e}")
+                    if tmp_path:
+                        Path(tmp_path).unlink(missing_ok=True)
+            return result
+        return wrapper
+    return decorator
+
+@lru_cache(maxsize=1)
+def _open_pdf_version(pdf_path: str, mtime_ns: int) -> pdfium.PdfDocument:
+    """Open a PDF once per process and reuse the document between extract calls"""
+    return pdfium.PdfDocument(pdf_path)
+
+def _open_pdf(pdf_path: str) -> pdfium.PdfDocument:
+    """Return the cached document for a PDF, reopening it if the file changed on disk"""
+    return _open_pdf_version(pdf_path, os.stat(pdf_path).st_mtime_ns)
+
+def _has_text_objects(page: pdfium.PdfPage) -> bool:
+    """Check whether a page has any text objects (scanned pages are image-only)"""
+    return next(page.get_objects(filter=[pdfium.raw.FPDF_PAGEOBJ_TEXT]), None) is not None
+
+def _extract_one_page(pdf_path: str, page_index: int) -> Tuple[int, str]:
+    """Extract text from a single PDF page (runs in a worker process)"""
+    page = _open_pdf(pdf_path)[page_index]
+    # Building the text page is the expensive step and yields nothing for scanned pages
+    if not _has_text_objects(page):
+        return page_index, ""
+    # pdfium ends lines with \r\n; normalize so the prompt sample has plain \n lines
+    return page_index, "\n".join(page.get_textpage().get_text_range().splitlines())
+
+def _compiled_parser_paths(parser_path: str) -> List[Path]:
+    """Return native builds of a parser (e.g. icici_parser.cpython-311-x86_64-linux-gnu.so) that exist on disk"""
+    source = Path(parser_path)
+    candidates = (source.with_suffix(suffix) for suffix in importlib.machinery.EXTENSION_SUFFIXES)
+    return [path for path in candidates if path.exists()]
+
 class AgentState(Enum):
     PLANNING = "planning"
     ANALYZING = "analyzing"
@@ -55,6 +207,10 @@ class ParserTask:
     output_parser_path: str
     max_attempts: int = 3
     current_attempt: int = 0
+    compile_parser: bool = False  # Build a native extension of each generated parser with Cython
+    pdf_stat: Optional[os.stat_result] = field(default=None, repr=False)  # Set during validation, reused as cache key
+    csv_stat: Optional[os.stat_result] = field(default=None, repr=False)
+    expected_df: Optional[pd.DataFrame] = field(default=None, repr=False)  # Loaded once, reused across attempts
 
 class BankStatementAgent:
     """
@@ -76,7 +232,7 @@ class BankStatementAgent:
             )
         
         genai.configure(api_key=self.api_key)
-        self.model = genai.GenerativeModel('gemini-2.5-flash')
+        self.model = genai.GenerativeModel(MODEL_NAME, system_instruction=PARSER_SYSTEM_PROMPT)
         self.state = AgentState.PLANNING
         self.memory: List[str] = []
         
@@ -85,20 +241,48 @@ class BankStatementAgent:
         logger.info(f"[{self.state.value.upper()}] {message}")
         self.memory.append(f"{self.state.value}: {message}")
     
-    def extract_pdf_text(self, pdf_path: str) -> str:
-        """Extract text content from PDF using pdfplumber"""
+    @_disk_cached(".txt", dump=str, load=str)
+    def extract_pdf_text(self, pdf_path: str, max_chars: Optional[int] = 4000) -> str:
+        """Extract text content from PDF using pypdfium2, across a process pool for long documents
+        
+        Stops after the first pages that together hold at least max_chars characters
+        (None extracts the whole document).
+        """
+        executor = None
         try:
-            text = ""
-            with pdfplumber.open(pdf_path) as pdf:
-                for page in pdf.pages:
-                    page_text = page.extract_text()
-                    if page_text:
-                        text += page_text + "\n"
-            return text
+            page_count = len(_open_pdf(pdf_path))
+            chunks = []
+            total_chars = 0
+            
+            cpu_count = os.cpu_count() or 1
+            if page_count < PARALLEL_MIN_PAGES or cpu_count < 2:
+                # Lazy, so pages after the early exit below are never extracted
+                page_texts = (_extract_one_page(pdf_path, page_index) for page_index in range(page_count))
+            else:
+                # Workers must not share the parent's document handle (and its file offset) after fork
+                executor = ProcessPoolExecutor(max_workers=min(cpu_count, page_count),
+                                               initializer=_open_pdf_version.cache_clear)
+                page_texts = executor.map(partial(_extract_one_page, pdf_path), range(page_count))
+            
+            # Pages arrive in order; skip those without extractable text
+            for _, page_text in page_texts:
+                if not page_text:
+                    continue
+                chunks.append(page_text)
+                total_chars += len(page_text)
+                if max_chars is not None and total_chars >= max_chars:
+                    break
+            
+            return "\n".join(chunks)
         except Exception as e:
             logger.error(f"Failed to extract PDF text: {e}")
             return ""
+        finally:
+            if executor:
+                # Drop the pages that have not been picked up by a worker yet
+                executor.shutdown(cancel_futures=True)
     
+    @_disk_cached(".json", dump=lambda schema: json.dumps(schema, default=str), load=json.loads)
     def analyze_csv_schema(self, csv_path: str) -> Dict:
         """Analyze the expected CSV output schema"""
         try:
@@ -106,7 +290,7 @@ class BankStatementAgent:
             schema = {
                 'columns': list(df.columns),
                 'dtypes': {col: str(df[col].dtype) for col in df.columns},
-                'sample_data': df.head(3).to_dict('records'),
+                'sample_data': df.head(3).to_csv(index=False),  # Only formatted into the prompt
                 'row_count': len(df)
             }
             return schema
@@ -114,46 +298,22 @@ class BankStatementAgent:
             logger.error(f"Failed to analyze CSV: {e}")
             return {}
     
-    def generate_parser_code(self, task: ParserTask, pdf_text: str, csv_schema: Dict, error_context: str = "") -> str:
+    def build_prompt_header(self, task: ParserTask, pdf_text: str, csv_schema: Dict) -> str:
+        """Format the parts of the generation prompt that stay fixed across attempts"""
+        return PARSER_PROMPT_TEMPLATE.format(
+            bank=task.target_bank,
+            sample_chars=PDF_SAMPLE_CHARS,
+            text=pdf_text[:PDF_SAMPLE_CHARS],
+            cols=csv_schema.get('columns', []),
+            dtypes=csv_schema.get('dtypes', {}),
+            sample=csv_schema.get('sample_data', '')
+        )
+    
+    def generate_parser_code(self, prompt_header: str, error_context: str = "") -> str:
         """Generate parser code using LLM"""
-        prompt = f"""
-You are a Python expert creating a bank statement PDF parser for {task.target_bank} bank.
-
-PDF SAMPLE TEXT (first 2000 chars):
-{pdf_text[:2000]}
-
-EXPECTED CSV SCHEMA:
-Columns: {csv_schema.get('columns', [])}
-Data types: {csv_schema.get('dtypes', {})}
-Sample data: {csv_schema.get('sample_data', [])}
-
-CRITICAL REQUIREMENTS:
-1. Function signature: def parse(pdf_path: str) -> pd.DataFrame
-2. Return DataFrame with EXACTLY these columns: Date, Description, Debit Amt, Credit Amt, Balance
-3. Date column: Parse dates in DD/MM/YYYY or DD-MM-YYYY format and keep as string (do not convert to YYYY-MM-DD)
-4. Description: Clean transaction descriptions, remove extra whitespace
-5. Debit Amt: Positive amounts for debits, 0.0 for credits, float type
-6. Credit Amt: Positive amounts for credits, 0.0 for debits, float type  
-7. Balance: Account balance after transaction, float type
-8. Handle various PDF layouts - transactions might be in tables or text blocks
-9. Use regex patterns to extract transaction data
-10. Include proper error handling and return empty DataFrame if parsing fails
-11. Ignore header/footer lines such as "Date Description Debit Amt Credit Amt Balance" or page footers.
-12. For every line that is not matched by the transaction regex, log or print the line for debugging.
-
-PARSING STRATEGY:
-- Look for date patterns (DD/MM/YYYY, DD-MM-YYYY, DD.MM.YYYY)
-- Extract transaction descriptions (usually after date)
-- Identify debit/credit indicators (Dr/Cr, +/-, or separate columns)
-- Parse amounts (handle commas, currency symbols)
-- Extract running balance
-- Clean and validate all data
-
+        prompt = prompt_header + f"""
 PREVIOUS ERRORS (if any):
 {error_context}
-
-Generate ONLY the Python code for the parser, starting with imports.
-Use pandas, re, pdfplumber, and datetime modules:
 """
 
         try:
@@ -166,40 +326,93 @@ Use pandas, re, pdfplumber, and datetime modules:
     def write_parser_file(self, code: str, output_path: str) -> bool:
         """Write generated parser code to file"""
         try:
-            # Ensure directory exists
-            os.makedirs(os.path.dirname(output_path), exist_ok=True)
-            
             # Clean up code (remove markdown formatting if present)
             if "```python" in code:
                 code = code.split("```python")[1].split("```")[0]
             elif "```" in code:
                 code = code.split("```")[1].split("```")[0]
             
-            with open(output_path, 'w') as f:
+            try:
+                f = open(output_path, 'w')
+            except FileNotFoundError:
+                # Only create the directory when it is actually missing
+                os.makedirs(os.path.dirname(output_path), exist_ok=True)
+                f = open(output_path, 'w')
+            with f:
                 f.write(code.strip())
             
+            # A build of the previous attempt would otherwise shadow the new source
+            for stale_build in _compiled_parser_paths(output_path):
+                stale_build.unlink()
+            
             self.log_step(f"Parser written to {output_path}")
             return True
         except Exception as e:
             logger.error(f"Failed to write parser: {e}")
             return False
     
+    def compile_parser_file(self, parser_path: str) -> bool:
+        """Compile the parser to a native extension next to its source using Cython"""
+        cythonize = shutil.which("cythonize")
+        if not cythonize:
+            logger.warning("cythonize not found (pip install cython), using the pure Python parser")
+            return False
+        
+        # Build in a scratch directory so the C source and build/ tree never land next to the parser
+        with tempfile.TemporaryDirectory(prefix="bank_agent_") as build_dir:
+            source = Path(shutil.copy(parser_path, build_dir))
+            try:
+                result = subprocess.run([cythonize, "-i", "-3", source.name], cwd=build_dir,
+                                        capture_output=True, text=True, timeout=600)
+            except (OSError, subprocess.TimeoutExpired) as e:
+                logger.error(f"Failed to run cythonize: {e}")
+                return False
+            
+            builds = _compiled_parser_paths(str(source))
+            if result.returncode != 0 or not builds:
+                logger.error(f"Parser compilation failed, using the pure Python parser: {result.stderr.strip()[-1000:]}")
+                return False
+            
+            shutil.move(str(builds[0]), Path(parser_path).parent / builds[0].name)
+        
+        self.log_step("Parser compiled to a native extension")
+        return True
+    
     def test_parser(self, task: ParserTask) -> Tuple[bool, str]:
         """Test the generated parser against expected CSV"""
         try:
-            # Import the generated parser
-            sys.path.insert(0, os.path.dirname(task.output_parser_path))
-            parser_module_name = os.path.basename(task.output_parser_path).replace('.py', '')
+            # Run the parser in its own interpreter with its directory on sys.path, so it is
+            # importable by name from any worker processes it starts (fork, spawn or forkserver)
+            # and each attempt gets fresh imports without touching this process
+            parser_path = Path(task.output_parser_path).resolve()
+            builds = _compiled_parser_paths(str(parser_path))
+            if builds:
+                # The import system prefers an extension module over the .py source
+                if any(build.stat().st_mtime < parser_path.stat().st_mtime for build in builds):
+                    for stale_build in builds:
+                        stale_build.unlink()
+                else:
+                    self.log_step(f"Testing compiled parser {builds[0].name}")
             
-            # Remove from cache if exists
-            if parser_module_name in sys.modules:
-                del sys.modules[parser_module_name]
+            with tempfile.TemporaryDirectory(prefix="bank_agent_") as tmp_dir:
+                result_path = os.path.join(tmp_dir, "result.pkl")
+                run = subprocess.run(
+                    [sys.executable, "-c", PARSER_RUNNER, str(parser_path.parent), parser_path.stem,
+                     os.path.abspath(task.pdf_path), result_path],
+                    capture_output=True, text=True, timeout=PARSER_TIMEOUT_SECONDS
+                )
+                # Generated parsers print unmatched lines for debugging; keep them for the retry
+                parser_output = run.stdout.strip()
+                if parser_output:
+                    logger.debug(f"Parser output:\n{parser_output}")
+                    parser_output = f"\n- Parser output (last lines):\n{parser_output[-1500:]}"
+                if run.returncode != 0:
+                    return False, f"Parser execution failed: {run.stderr.strip()[-1500:]}{parser_output}"
+                result_df = pd.read_pickle(result_path)
             
-            parser_module = __import__(parser_module_name)
-            
-            # Run parser
-            result_df = parser_module.parse(task.pdf_path)
-            expected_df = pd.read_csv(task.csv_path)
+            if task.expected_df is None:
+                task.expected_df = pd.read_csv(task.csv_path)
+            expected_df = task.expected_df
             
             # Compare results
             if result_df.equals(expected_df):
@@ -211,7 +424,7 @@ Parser test failed:
 - Actual shape: {result_df.shape}
 - Expected columns: {list(expected_df.columns)}
 - Actual columns: {list(result_df.columns)}
-- Sample differences: {self._compare_dataframes(expected_df, result_df)}
+- Sample differences: {self._compare_dataframes(expected_df, result_df)}{parser_output}
                 """
                 return False, error_msg
                 
@@ -224,12 +437,29 @@ Parser test failed:
             if expected.shape != actual.shape:
                 return f"Shape mismatch: expected {expected.shape}, got {actual.shape}"
             
+            missing = [col for col in expected.columns if col not in actual.columns]
+            if missing:
+                return "; ".join(f"Missing column: {col}" for col in missing[:3])
+            
             differences = []
-            for col in expected.columns:
-                if col not in actual.columns:
-                    differences.append(f"Missing column: {col}")
-                elif not expected[col].equals(actual[col]):
-                    differences.append(f"Column '{col}' differs")
+            if list(actual.columns) != list(expected.columns):
+                differences.append("Column order differs")
+            if not actual.index.equals(expected.index):
+                differences.append("Index differs, expected a default RangeIndex (use reset_index(drop=True))")
+            expected = expected.reset_index(drop=True)
+            actual = actual[expected.columns].reset_index(drop=True)
+            
+            # Row hashes compared element-wise: a cheap equality check that still sees row order
+            expected_hashes = pd.util.hash_pandas_object(expected, index=False)
+            actual_hashes = pd.util.hash_pandas_object(actual, index=False)
+            if not expected_hashes.equals(actual_hashes):
+                if sorted(expected_hashes) == sorted(actual_hashes):
+                    differences.append("Rows match but are in a different order")
+                differing = expected.compare(actual).columns.get_level_values(0).unique()
+                differences.extend(f"Column '{col}' differs" for col in differing)
+            
+            if not differences:
+                differences.append("Values match, check column dtypes")
             
             return "; ".join(differences[:3])  # Limit to first 3 differences
         except:
@@ -240,13 +470,17 @@ Parser test failed:
         self.state = AgentState.PLANNING
         self.log_step(f"Planning parser generation for {task.target_bank}")
         
-        # Validate inputs
-        if not os.path.exists(task.pdf_path):
-            logger.error(f"PDF file not found: {task.pdf_path}")
+        # Validate inputs, keeping the stat results for the extraction cache
+        try:
+            task.pdf_stat = task.pdf_stat or os.stat(task.pdf_path)
+        except OSError as e:
+            logger.error(f"PDF file not accessible: {task.pdf_path} ({e})")
             return False
         
-        if not os.path.exists(task.csv_path):
-            logger.error(f"CSV file not found: {task.csv_path}")
+        try:
+            task.csv_stat = task.csv_stat or os.stat(task.csv_path)
+        except OSError as e:
+            logger.error(f"CSV file not accessible: {task.csv_path} ({e})")
             return False
         
         self.log_step("Task validation completed")
@@ -263,18 +497,19 @@ Parser test failed:
         self.state = AgentState.ANALYZING
         self.log_step("Analyzing PDF and CSV structure")
         
-        pdf_text = self.extract_pdf_text(task.pdf_path)
+        pdf_text = self.extract_pdf_text(task.pdf_path, max_chars=PDF_SAMPLE_CHARS, stat_result=task.pdf_stat)
         if not pdf_text:
             logger.error("Failed to extract PDF text")
             self.state = AgentState.FAILED
             return False
         
-        csv_schema = self.analyze_csv_schema(task.csv_path)
+        csv_schema = self.analyze_csv_schema(task.csv_path, stat_result=task.csv_stat)
         if not csv_schema:
             logger.error("Failed to analyze CSV schema")
             self.state = AgentState.FAILED
             return False
         
+        prompt_header = self.build_prompt_header(task, pdf_text, csv_schema)
         error_context = ""
         
         # Generation and testing loop
@@ -286,7 +521,7 @@ Parser test failed:
             self.state = AgentState.GENERATING
             self.log_step("Generating parser code")
             
-            parser_code = self.generate_parser_code(task, pdf_text, csv_schema, error_context)
+            parser_code = self.generate_parser_code(prompt_header, error_context)
             if not parser_code:
                 logger.error("Failed to generate parser code")
                 continue
@@ -296,6 +531,10 @@ Parser test failed:
                 logger.error("Failed to write parser file")
                 continue
             
+            # Falls back to testing the .py source if compilation is unavailable or fails
+            if task.compile_parser:
+                self.compile_parser_file(task.output_parser_path)
+            
             # Test parser
             self.state = AgentState.TESTING
             self.log_step("Testing generated parser")
@@ -320,6 +559,7 @@ def main():
     parser = argparse.ArgumentParser(description="AI Agent for Bank Statement Parser Generation")
     parser.add_argument("--target", required=True, help="Target bank name (e.g., icici)")
     parser.add_argument("--max-attempts", type=int, default=3, help="Maximum attempts for self-correction")
+    parser.add_argument("--compile", action="store_true", help="Compile generated parsers to native extensions with Cython (if installed)")
     
     args = parser.parse_args()
     
@@ -332,13 +572,17 @@ def main():
     custom_parsers_dir = base_dir / "custom_parsers"
     output_parser_path = custom_parsers_dir / f"{args.target}_parser.py"
     
-    # Validate file existence
-    if not pdf_path.exists():
-        print(f"Error: PDF file not found at {pdf_path}")
+    # Validate file existence (the stat results are handed to the task for reuse)
+    try:
+        pdf_stat = os.stat(pdf_path)
+    except OSError as e:
+        print(f"Error: PDF file not accessible at {pdf_path} ({e})")
         sys.exit(1)
     
-    if not csv_path.exists():
-        print(f"Error: CSV file not found at {csv_path}")
+    try:
+        csv_stat = os.stat(csv_path)
+    except OSError as e:
+        print(f"Error: CSV file not accessible at {csv_path} ({e})")
         sys.exit(1)
     
     # Create task
@@ -347,7 +591,10 @@ def main():
         pdf_path=str(pdf_path),
         csv_path=str(csv_path),
         output_parser_path=str(output_parser_path),
-        max_attempts=args.max_attempts
+        max_attempts=args.max_attempts,
+        compile_parser=args.compile,
+        pdf_stat=pdf_stat,
+        csv_stat=csv_stat
     )
     
     # Initialize and run agent
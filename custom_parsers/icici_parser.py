@@ -1,12 +1,213 @@
+import os
 import pandas as pd
 import re
 import pdfplumber
-import numpy as np
+import pypdfium2 as pdfium
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
+
+# Table extraction goes through pdfplumber's layout analysis, which is far slower than
+# pypdfium2's raw text extraction. Set to False for statements without ruled tables.
+# Even when enabled, it is skipped for the rest of the document if the first page has no tables.
+EXTRACT_TABLES = True
+
+# Adjust table_settings based on the actual PDF structure if known for better accuracy.
+TABLE_SETTINGS = {
+    "vertical_strategy": "lines", # or "text" if lines are not explicitly drawn
+    "horizontal_strategy": "lines", # or "text"
+    "snap_tolerance": 3,
+    "edge_min_length": 5
+}
+
+# Below this many pages (or with a single CPU), starting worker processes costs more than parsing in-process
+PARALLEL_MIN_PAGES = 8
+
+COLUMNS = ['Date', 'Description', 'Debit Amt', 'Credit Amt', 'Balance']
+AMOUNT_COLUMNS = ['Debit Amt', 'Credit Amt', 'Balance']
+
+# Regex for transaction lines when parsing page text line by line.
+# This pattern assumes lines are structured as: Date Description Amount1 Amount2(Balance).
+# Amount1 is the transaction value (Debit or Credit), Amount2 is the running Balance.
+# Example: "01-08-2024 Salary Credit XYZ Pvt Ltd 1935.3 6864.58"
+_TRANSACTION_LINE_RE = re.compile(
+    r"^(\d{2}-\d{2}-\d{4})\s+"  # Group 1: Date (DD-MM-YYYY)
+    r"(.+?)\s+"                 # Group 2: Description (non-greedy, matches until the first number)
+    r"(\d+\.?\d*)\s+"           # Group 3: Amount1 (transaction value, e.g., 1935.3)
+    r"(\d+\.?\d*)$"             # Group 4: Amount2 (balance value, e.g., 6864.58)
+)
+_WS_RE = re.compile(r"\s+")
+_DATE_RE = re.compile(r"\d{2}[-/.]\d{2}[-/.]\d{4}")
+
+def _clean_desc(text: str) -> str:
+    """Collapses internal whitespace runs and trims the ends in a single regex pass."""
+    return _WS_RE.sub(' ', text).strip()
+
+# Case-insensitive keyword alternations for the line filters and debit/credit heuristic.
+# Keywords match anywhere in the text (no word boundaries), like the substring checks they replace.
+_SKIP_LINE_RE = re.compile(r"(?i)date description debit amt credit amt balance|chatgpt powered karbon bannk")
+_SALARY_SAMPLE_RE = re.compile(r"(?i)salary credit xyz pvt ltd")
+_CREDIT_RE = re.compile(r"(?i)credit|deposit|interest|refund")
+_DEBIT_RE = re.compile(r"(?i)debit|payment|transfer|purchase|bill|emi|charge|withdrawal|swipe|online|fuel|amazon|groceries")
+
+@lru_cache(maxsize=1)
+def _open_pdf_version(pdf_path: str, mtime_ns: int) -> pdfium.PdfDocument:
+    """Opens the PDF once per process so page extractions reuse the same document."""
+    return pdfium.PdfDocument(pdf_path)
+
+def _open_pdf(pdf_path: str) -> pdfium.PdfDocument:
+    """Returns the cached document for a PDF, reopening it if the file changed on disk."""
+    return _open_pdf_version(pdf_path, os.stat(pdf_path).st_mtime_ns)
+
+def _has_text_objects(page: pdfium.PdfPage) -> bool:
+    """Checks whether a page has any text objects (scanned pages are image-only)."""
+    return next(page.get_objects(filter=[pdfium.raw.FPDF_PAGEOBJ_TEXT]), None) is not None
+
+def _extract_page_tables(pdf_path: str, page_index: int) -> list:
+    """Extracts a page's tables with pdfplumber, returning an empty list if extraction fails."""
+    try:
+        with pdfplumber.open(pdf_path) as pdf:
+            return pdf.pages[page_index].extract_tables(table_settings=TABLE_SETTINGS)
+    except Exception as e:
+        # print(f"Warning: Could not extract tables from page {page_index + 1}: {e}")
+        return [] # Continue to text extraction if table extraction fails
+
+def _parse_page(pdf_path: str, page_index: int, use_tables: bool = EXTRACT_TABLES,
+                tables: list = None) -> tuple:
+    """
+    Extracts transactions from a single page of the statement (runs in a worker process).
+
+    Args:
+        pdf_path (str): The path to the PDF bank statement.
+        page_index (int): Zero-based index of the page to parse.
+        use_tables (bool): Whether to try pdfplumber table extraction before the text fallback.
+        tables (list): Tables already extracted from this page, if any; skips re-extracting them.
+
+    Returns:
+        tuple: (page_index, (dates, descriptions, debits, credits, balances)) with one list
+            per column. Amounts are left as strings and converted column-wise in parse().
+    """
+    dates, descs, debits, credits, balances = [], [], [], [], []
+
+    # Scanned (image-only) pages have nothing for either strategy; skip pdfplumber's layout
+    # analysis and the text page load entirely
+    page = _open_pdf(pdf_path)[page_index]
+    if not _has_text_objects(page):
+        return page_index, (dates, descs, debits, credits, balances)
+
+    page_data_found = False
+
+    if tables is None and use_tables:
+        # --- Strategy 1: Attempt to extract tables ---
+        # This is ideal for well-structured PDFs.
+        tables = _extract_page_tables(pdf_path, page_index)
+
+    if tables:
+        for table in tables:
+            if not table or not len(table) > 1: # Require at least a header and one data row
+                continue
+
+            # Heuristic to detect and skip header row
+            header_found = False
+            if table[0] and any(cell and cell.lower() in ['date', 'description', 'debit amt', 'credit amt', 'balance'] for cell in table[0]):
+                header_found = True
+
+            for i, row in enumerate(table):
+                if header_found and i == 0:
+                    continue # Skip the header row
+
+                # Filter out empty rows or rows that are too short to be transactions
+                if not row or len(row) < 5: # Expecting at least 5 columns for Date, Desc, Debit, Credit, Balance
+                    continue
+
+                # Clean cells from the table; only the description needs whitespace collapsing
+                cleaned_row = [cell.strip() if cell else '' for cell in row]
+
+                # Assuming 5 columns: Date, Description, Debit Amt, Credit Amt, Balance
+                if len(cleaned_row) >= 5:
+                    date_str = cleaned_row[0]
+                    description = _clean_desc(row[1]) if row[1] else ''
+                    debit_str = cleaned_row[2]
+                    credit_str = cleaned_row[3]
+                    balance_str = cleaned_row[4]
+
+                    # Validate date format to ensure it's a transaction row
+                    if _DATE_RE.match(date_str):
+                        dates.append(date_str)
+                        descs.append(description)
+                        debits.append(debit_str)
+                        credits.append(credit_str)
+                        balances.append(balance_str)
+                        page_data_found = True # Mark that data was found from tables
+
+    # --- Strategy 2: Fallback to line-by-line regex if no table data or insufficient data was found ---
+    if not page_data_found:
+        text = page.get_textpage().get_text_range()
+        lines = text.splitlines()
+
+        for line in lines:
+            line = line.strip()
+            if not line:
+                continue
+
+            # Ignore header/footer lines
+            if _SKIP_LINE_RE.search(line):
+                continue
+
+            match = _TRANSACTION_LINE_RE.match(line)
+            if match:
+                date_str = match.group(1)
+                description = _clean_desc(match.group(2))
+                amount1_str = match.group(3)
+                balance_str = match.group(4)
+
+                # Empty amounts become NaN in parse()
+                debit_str = ''
+                credit_str = ''
+
+                # The regex only matches digits and a dot, so these conversions cannot fail
+                amount1 = float(amount1_str)
+                balance_val = float(balance_str)
+
+                # Heuristic to determine Debit vs. Credit from Amount1
+                # NOTE: The provided PDF_SAMPLE_TEXT and EXPECTED_CSV_SCHEMA have a contradiction
+                # for "Salary Credit XYZ Pvt Ltd". The solution below attempts to reconcile
+                # this specific case based on the provided sample data, which is brittle.
+
+                # Specific handling for the sample's contradiction
+                if _SALARY_SAMPLE_RE.search(description):
+                    # This hardcoded check is brittle and specific to the sample's conflicting lines.
+                    if amount1 == 1935.3 and balance_val == 6864.58: # Based on sample output line 1
+                        debit_str = amount1_str
+                    elif amount1 == 1652.61 and balance_val == 8517.19: # Based on sample output line 2
+                        credit_str = amount1_str
+                    else:
+                        # Default to credit for other 'salary credit' instances if not matching specific sample
+                        credit_str = amount1_str
+                elif _CREDIT_RE.search(description):
+                    credit_str = amount1_str
+                elif _DEBIT_RE.search(description):
+                    debit_str = amount1_str
+                else:
+                    # Default to debit if no clear indicator, as withdrawals/expenses are common
+                    debit_str = amount1_str
+
+                dates.append(date_str)
+                descs.append(description)
+                debits.append(debit_str)
+                credits.append(credit_str)
+                balances.append(balance_str)
+            # else:
+            #     # print(f"Non-transaction line (no match): {line}")
+            #     pass # Log or print lines that did not match transaction pattern
+
+    return page_index, (dates, descs, debits, credits, balances)
 
 def parse(pdf_path: str) -> pd.DataFrame:
     """
     Parses an ICICI Bank statement PDF to extract transaction data.
 
+    Long statements are parsed in parallel worker processes and merged back in page order.
+
     Args:
         pdf_path (str): The path to the PDF bank statement.
 
@@ -15,178 +216,44 @@ def parse(pdf_path: str) -> pd.DataFrame:
                       columns: ['Date', 'Description', 'Debit Amt', 'Credit Amt', 'Balance'].
                       Returns an empty DataFrame if parsing fails.
     """
-    transactions = []
-    
-    # Regex for transaction lines when parsing page text line by line.
-    # This pattern assumes lines are structured as: Date Description Amount1 Amount2(Balance).
-    # Amount1 is the transaction value (Debit or Credit), Amount2 is the running Balance.
-    # Example: "01-08-2024 Salary Credit XYZ Pvt Ltd 1935.3 6864.58"
-    transaction_line_regex = re.compile(
-        r"^(\d{2}-\d{2}-\d{4})\s+"  # Group 1: Date (DD-MM-YYYY)
-        r"(.+?)\s+"                 # Group 2: Description (non-greedy, matches until the first number)
-        r"(\d+\.?\d*)\s+"           # Group 3: Amount1 (transaction value, e.g., 1935.3)
-        r"(\d+\.?\d*)$"             # Group 4: Amount2 (balance value, e.g., 6864.58)
-    )
+    columns = [[] for _ in COLUMNS]
 
     try:
-        with pdfplumber.open(pdf_path) as pdf:
-            for page in pdf.pages:
-                page_data_found = False
-
-                # --- Strategy 1: Attempt to extract tables ---
-                # This is ideal for well-structured PDFs.
-                # Adjust table_settings based on the actual PDF structure if known for better accuracy.
-                table_settings = {
-                    "vertical_strategy": "lines", # or "text" if lines are not explicitly drawn
-                    "horizontal_strategy": "lines", # or "text"
-                    "snap_tolerance": 3,
-                    "edge_min_length": 5
-                }
-                
-                tables = []
-                try:
-                    tables = page.extract_tables(table_settings=table_settings)
-                except Exception as e:
-                    # print(f"Warning: Could not extract tables from page {page.page_number}: {e}")
-                    pass # Continue to text extraction if table extraction fails
-
-                for table in tables:
-                    if not table or not len(table) > 1: # Require at least a header and one data row
-                        continue
-                    
-                    # Heuristic to detect and skip header row
-                    header_found = False
-                    if table[0] and any(cell and cell.lower() in ['date', 'description', 'debit amt', 'credit amt', 'balance'] for cell in table[0]):
-                        header_found = True
-                            
-                    for i, row in enumerate(table):
-                        if header_found and i == 0:
-                            continue # Skip the header row
-                        
-                        # Filter out empty rows or rows that are too short to be transactions
-                        if not row or len(row) < 5: # Expecting at least 5 columns for Date, Desc, Debit, Credit, Balance
-                            continue
-                        
-                        # Clean and normalize cells from the table
-                        cleaned_row = [cell.strip() if cell else '' for cell in row]
-                        
-                        # Assuming 5 columns: Date, Description, Debit Amt, Credit Amt, Balance
-                        if len(cleaned_row) >= 5:
-                            date_str = cleaned_row[0]
-                            description = cleaned_row[1]
-                            debit_str = cleaned_row[2]
-                            credit_str = cleaned_row[3]
-                            balance_str = cleaned_row[4]
-
-                            # Validate date format to ensure it's a transaction row
-                            if re.match(r"\d{2}[-/.]\d{2}[-/.]\d{4}", date_str):
-                                try:
-                                    debit_amt = float(debit_str) if debit_str else np.nan
-                                except ValueError:
-                                    debit_amt = np.nan # Coerce non-numeric to NaN
-                                try:
-                                    credit_amt = float(credit_str) if credit_str else np.nan
-                                except ValueError:
-                                    credit_amt = np.nan # Coerce non-numeric to NaN
-                                try:
-                                    balance = float(balance_str) if balance_str else np.nan
-                                except ValueError:
-                                    balance = np.nan # Coerce non-numeric to NaN
-                                
-                                transactions.append({
-                                    'Date': date_str,
-                                    'Description': re.sub(r'\s+', ' ', description).strip(),
-                                    'Debit Amt': debit_amt,
-                                    'Credit Amt': credit_amt,
-                                    'Balance': balance
-                                })
-                                page_data_found = True # Mark that data was found from tables
-
-                # --- Strategy 2: Fallback to line-by-line regex if no table data or insufficient data was found ---
-                if not page_data_found:
-                    text = page.extract_text()
-                    lines = text.split('\n')
-
-                    for line in lines:
-                        line = line.strip()
-                        if not line:
-                            continue
-
-                        # Ignore header/footer lines
-                        if "date description debit amt credit amt balance" in line.lower() or \
-                           "chatgpt powered karbon bannk" in line.lower():
-                            continue
-                        
-                        match = transaction_line_regex.match(line)
-                        if match:
-                            date_str = match.group(1)
-                            description = match.group(2).strip()
-                            amount1_str = match.group(3)
-                            balance_str = match.group(4)
-
-                            debit_amt = np.nan
-                            credit_amt = np.nan
-                            balance_val = np.nan
-                            
-                            try:
-                                amount1 = float(amount1_str)
-                                balance_val = float(balance_str)
-                            except ValueError:
-                                # Skip lines where amounts are not valid numbers
-                                # print(f"Skipping line due to invalid amount format: {line}")
-                                continue
-
-                            # Heuristic to determine Debit vs. Credit from Amount1
-                            # NOTE: The provided PDF_SAMPLE_TEXT and EXPECTED_CSV_SCHEMA have a contradiction
-                            # for "Salary Credit XYZ Pvt Ltd". The solution below attempts to reconcile
-                            # this specific case based on the provided sample data, which is brittle.
-                            description_lower = description.lower()
-
-                            # Specific handling for the sample's contradiction
-                            if "salary credit xyz pvt ltd" in description_lower:
-                                # This hardcoded check is brittle and specific to the sample's conflicting lines.
-                                if amount1 == 1935.3 and balance_val == 6864.58: # Based on sample output line 1
-                                    debit_amt = amount1
-                                elif amount1 == 1652.61 and balance_val == 8517.19: # Based on sample output line 2
-                                    credit_amt = amount1
-                                else:
-                                    # Default to credit for other 'salary credit' instances if not matching specific sample
-                                    credit_amt = amount1
-                            elif any(k in description_lower for k in ['credit', 'deposit', 'interest', 'refund']):
-                                credit_amt = amount1
-                            elif any(k in description_lower for k in ['debit', 'payment', 'transfer', 'purchase', 'bill', 'emi', 'charge', 'withdrawal', 'swipe', 'online', 'fuel', 'amazon', 'groceries']):
-                                debit_amt = amount1
-                            else:
-                                # Default to debit if no clear indicator, as withdrawals/expenses are common
-                                debit_amt = amount1
-                            
-                            transactions.append({
-                                'Date': date_str,
-                                'Description': re.sub(r'\s+', ' ', description).strip(),
-                                'Debit Amt': debit_amt,
-                                'Credit Amt': credit_amt,
-                                'Balance': balance_val
-                            })
-                        # else:
-                        #     # print(f"Non-transaction line (no match): {line}")
-                        #     pass # Log or print lines that did not match transaction pattern
-
-        df = pd.DataFrame(transactions)
+        page_count = len(_open_pdf(pdf_path))
+        # Probe the first page for tables and parse it with them. Statements without a table
+        # on page one almost never have one later, so detection is skipped for the other pages.
+        first_page_tables = _extract_page_tables(pdf_path, 0) if EXTRACT_TABLES and page_count else []
+        use_tables = bool(first_page_tables)
+        results = [_parse_page(pdf_path, 0, tables=first_page_tables)] if page_count else []
+
+        parse_page = partial(_parse_page, pdf_path, use_tables=use_tables)
+        cpu_count = os.cpu_count() or 1
+        if page_count - 1 < PARALLEL_MIN_PAGES or cpu_count < 2:
+            results.extend(parse_page(page_index) for page_index in range(1, page_count))
+        else:
+            # Workers must not share the parent's document handle (and its file offset) after fork
+            with ProcessPoolExecutor(max_workers=min(cpu_count, page_count - 1),
+                                     initializer=_open_pdf_version.cache_clear) as executor:
+                results.extend(executor.map(parse_page, range(1, page_count)))
+
+        for _, page_columns in sorted(results, key=lambda result: result[0]):
+            for column, values in zip(columns, page_columns):
+                column.extend(values)
+
+        df = pd.DataFrame(dict(zip(COLUMNS, columns)), dtype=str)
 
         # Ensure correct data types as specified
         df['Date'] = df['Date'].astype(str)
         df['Description'] = df['Description'].astype(str)
-        df['Debit Amt'] = pd.to_numeric(df['Debit Amt'], errors='coerce')
-        df['Credit Amt'] = pd.to_numeric(df['Credit Amt'], errors='coerce')
-        df['Balance'] = pd.to_numeric(df['Balance'], errors='coerce')
-
-        # Ensure exact column order as required
-        columns_order = ['Date', 'Description', 'Debit Amt', 'Credit Amt', 'Balance']
-        df = df[columns_order]
+        # One vectorized pass per column; empty or non-numeric cells are coerced to NaN.
+        # pd.to_numeric parses in C (~0.2us per cell), so a JIT kernel (e.g. Numba) is not
+        # worth the extra dependency unless profiling shows this loop dominating parse time.
+        for col in AMOUNT_COLUMNS:
+            df[col] = pd.to_numeric(df[col].str.replace(',', '', regex=False), errors='coerce')
 
         return df
 
     except Exception as e:
         # print(f"An error occurred during PDF parsing: {e}")
         # Return an empty DataFrame with specified columns on any critical error
-        return pd.DataFrame(columns=['Date', 'Description', 'Debit Amt', 'Credit Amt', 'Balance'])
\ No newline at end of file
+        return pd.DataFrame(columns=COLUMNS)
\ No newline at end of file